@@ -1,21 +1,67 @@
 #!/usr/bin/env python3
 """Generate daily summaries of Claude Code transcripts."""
 
+import contextlib
+import io
 import json
+import mmap
 import os
 import re
 import sqlite3
 import subprocess
 import tempfile
-from datetime import date, datetime, timedelta
+from bisect import bisect_left
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from itertools import accumulate, repeat
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator
 
 import anthropic
-from anthropic.types import TextBlock
 import click
 from dotenv import load_dotenv
 from markitdown import MarkItDown
 
+try:
+    # Optional: orjson parses transcript lines several times faster
+    import orjson  # pyright: ignore[reportMissingImports]
+    from orjson import loads as _json_loads  # pyright: ignore[reportMissingImports]
+except ImportError:
+    from json import loads as _json_loads
+
+    orjson = None
+
+try:
+    # Converting in-process avoids starting the CLI for every session
+    from claude_code_transcripts import generate_html as _generate_html
+except ImportError:
+    _generate_html = None
+
+try:
+    # Optional: selectolax extracts transcript text with a fast C parser
+    from selectolax.lexbor import (  # pyright: ignore[reportMissingImports]
+        LexborHTMLParser,
+    )
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    # Optional: hyperscan checks all secret patterns in one vectorized scan
+    import hyperscan  # pyright: ignore[reportMissingImports]
+except ImportError:
+    hyperscan = None
+
+if TYPE_CHECKING:
+    from hyperscan import (  # pyright: ignore[reportMissingImports]
+        Database as HyperscanDatabase,
+    )
+
 load_dotenv()
 
 CLAUDE_PROJECTS_DIR = Path.home() / ".claude" / "projects"
@@ -23,6 +69,11 @@ VSCODE_WORKSPACE_STORAGE_DIR = (
     Path.home() / "Library" / "Application Support" / "Code" / "User" / "workspaceStorage"
 )
 OPENCODE_DB = Path.home() / ".local" / "share" / "opencode" / "opencode.db"
+SCAN_CACHE_DB = Path.home() / ".cache" / "daily_summary" / "scan.sqlite"
+# Bump when scanning or counting changes, so older cached results are dropped
+SCAN_CACHE_VERSION = 2
+# Cached scans for target dates more than this many days ago are pruned
+SCAN_CACHE_KEEP_DAYS = 31
 OUTPUT_DIR = Path(
     os.getenv(
         "DAILY_SUMMARY_OUTPUT_DIR",
@@ -33,6 +84,30 @@ OUTPUT_DIR = Path(
     )
 )
 
+# Minimum total size (in bytes) of uncached transcripts before scanning them
+# in worker processes; each worker has to import this module first, which
+# costs about as long as scanning a few hundred MB in-process
+PARALLEL_SCAN_MIN_BYTES = 512 << 20
+
+# Minimum total size (in bytes) of filtered transcripts or HTML files before
+# converting them in worker processes; both conversions run at about 1 MB/s
+PARALLEL_CONVERT_MIN_BYTES = 4 << 20
+
+# Maximum transcript length (in characters) per project sent to Claude
+MAX_TRANSCRIPT_CHARS = 50_000
+
+# Size (in bytes) of each read when scanning transcript files
+READ_CHUNK_SIZE = 1 << 20
+
+# Amount of filtered JSONL (in bytes) decoded and sanitized per regex call
+SANITIZE_CHUNK_SIZE = 1 << 20
+
+# Bash commands counted as git commits (tolerates extra whitespace)
+_GIT_COMMIT_RE = re.compile(r"\bgit\s+commit\b")
+
+# Timestamps whose date _fast_date may take straight from the first 10 chars
+_ISO_DATE_PREFIX_RE = re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ]|\Z)", re.ASCII)
+
 # Patterns for detecting secrets (compiled for performance)
 SECRET_PATTERNS = [
     # API keys (generic patterns)
@@ -99,13 +174,241 @@ SECRET_PATTERNS = [
 ]
 
 
-def sanitize_secrets(text: str) -> str:
-    """Remove or obfuscate secrets from text."""
+def _compile_secret_prefilter(
+    patterns: list[tuple[re.Pattern[str], str]],
+) -> "HyperscanDatabase | None":
+    """Compile a hyperscan database that reports where secret patterns may match.
+
+    Prefilter mode accepts every construct the Python patterns use, and
+    every real match ends at an offset the database reports, except in text
+    holding one of _PREFILTER_BLIND_SPOTS. Returns None when hyperscan is
+    unavailable or cannot compile the set.
+    """
+    if hyperscan is None:
+        return None
+
+    expressions: list[bytes] = []
+    flags: list[int] = []
+    for pattern, _ in patterns:
+        source = pattern.pattern
+        pattern_flags = (
+            hyperscan.HS_FLAG_PREFILTER
+            | hyperscan.HS_FLAG_UTF8
+            | hyperscan.HS_FLAG_UCP
+        )
+        if pattern.flags & re.IGNORECASE:
+            source = source.removeprefix("(?i)")
+            pattern_flags |= hyperscan.HS_FLAG_CASELESS
+        expressions.append(source.encode())
+        flags.append(pattern_flags)
+
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=expressions, ids=list(range(len(expressions))), flags=flags
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+
+_SECRET_PREFILTER = _compile_secret_prefilter(SECRET_PATTERNS)
+
+# Characters Python's re matches more widely than hyperscan's UCP and
+# CASELESS modes: \s also covers the \x1c-\x1f separators, and IGNORECASE
+# folds these letters onto ASCII i, s and k. Text holding any of them
+# bypasses the prefilter, which could otherwise miss a match.
+_PREFILTER_BLIND_CHARS = "\x1c\x1d\x1e\x1f\u0130\u0131\u017f\u212a"
+_PREFILTER_BLIND_SPOTS = re.compile(f"[{_PREFILTER_BLIND_CHARS}]")
+_PREFILTER_BLIND_SPOTS_UTF8 = re.compile(
+    b"|".join(re.escape(char.encode()) for char in _PREFILTER_BLIND_CHARS)
+)
+
+
+def _may_contain_secret(text: str) -> bool:
+    """Check with the hyperscan prefilter whether text can contain a secret."""
+    if (
+        _SECRET_PREFILTER is None
+        or hyperscan is None
+        or _PREFILTER_BLIND_SPOTS.search(text)
+    ):
+        return True
+
+    hits: list[int] = []
+
+    def on_match(
+        pattern_id: int, start: int, end: int, flags: int, context: object
+    ) -> bool:
+        hits.append(pattern_id)
+        return True  # One hit is enough, stop scanning
+
+    try:
+        _SECRET_PREFILTER.scan(text.encode(), match_event_handler=on_match)
+    except hyperscan.ScanTerminated:
+        pass
+    return bool(hits)
+
+
+# Substrings at least one of which every secret pattern needs to match,
+# lowercase so they can be looked for in casefolded text
+_SECRET_MARKERS = (
+    "key",
+    "bearer",
+    "eyj",
+    "passw",
+    "pwd",
+    "secret",
+    "token",
+    "credent",
+    "auth",
+    "://",
+    "sk-",
+    "ghp_",
+    "github_pat_",
+    "xox",
+)
+
+
+def _has_secret_marker(text: str) -> bool:
+    """Check with plain substring searches whether text can contain a secret."""
+    folded = text.casefold()
+    return any(marker in folded for marker in _SECRET_MARKERS)
+
+
+def _apply_secret_patterns(text: str) -> str:
+    """Run every secret pattern over text in order, each on the previous result.
+
+    Rules overlap, so order matters: a later rule can still redact a secret
+    that an earlier, broader rule matched only partly.
+    """
     for pattern, replacement in SECRET_PATTERNS:
         text = pattern.sub(replacement, text)
     return text
 
 
+def _redact_within_lines(text: str) -> str | None:
+    """Apply the secret patterns like _apply_secret_patterns, line by line.
+
+    Returns None as soon as a match spans a line break, since redacting it
+    would merge or alter separate lines.
+    """
+    spans_lines = False
+
+    def redact(match: re.Match[str], replacement: str) -> str:
+        nonlocal spans_lines
+        if "\n" in match.group():
+            spans_lines = True
+        return match.expand(replacement)
+
+    for pattern, replacement in SECRET_PATTERNS:
+        text = pattern.sub(lambda match: redact(match, replacement), text)
+        if spans_lines:
+            return None
+    return text
+
+
+def sanitize_secrets(text: str) -> str:
+    """Remove or obfuscate secrets from text."""
+    if not _has_secret_marker(text) or not _may_contain_secret(text):
+        return text
+    return _apply_secret_patterns(text)
+
+
+def _sanitize_flagged_lines(
+    lines: list[bytes], prefilter: "HyperscanDatabase"
+) -> str:
+    """Decode raw JSONL lines, sanitizing only lines the hyperscan prefilter flags.
+
+    One hyperscan pass over the joined lines finds the lines holding a
+    reported match end, and lines holding one of _PREFILTER_BLIND_SPOTS are
+    flagged too; the others cannot contain a secret and are decoded as-is.
+    Flagged lines are sanitized one at a time, like the line by line
+    fallback of _sanitize_lines.
+    """
+    data = b"".join(lines)
+    line_ends = list(accumulate(map(len, lines)))
+    flagged: set[int] = set()
+
+    def on_match(
+        pattern_id: int, start: int, end: int, flags: int, context: object
+    ) -> bool:
+        flagged.add(bisect_left(line_ends, end))
+        return False
+
+    prefilter.scan(data, match_event_handler=on_match)
+    for match in _PREFILTER_BLIND_SPOTS_UTF8.finditer(data):
+        flagged.add(bisect_left(line_ends, match.end()))
+    if not flagged:
+        return data.decode()
+
+    parts: list[str] = []
+    clean_start = 0
+    for index in sorted(flagged):
+        if clean_start < index:
+            parts.append(b"".join(lines[clean_start:index]).decode())
+        parts.append(_apply_secret_patterns(lines[index].decode()))
+        clean_start = index + 1
+    parts.append(b"".join(lines[clean_start:]).decode())
+    return "".join(parts)
+
+
+def _sanitize_lines(lines: list[bytes]) -> str:
+    """Decode and sanitize raw JSONL lines in batches of about SANITIZE_CHUNK_SIZE.
+
+    Running the decoder and regex over a joined batch saves a call per line.
+    If a match spans a line break the batch is redone line by line, so JSONL
+    records never get merged or redacted by their neighbours. With
+    hyperscan, only flagged lines are run through the regex at all.
+    """
+    parts: list[str] = []
+    batch: list[bytes] = []
+    batch_size = 0
+
+    def flush() -> None:
+        if _SECRET_PREFILTER is not None:
+            parts.append(_sanitize_flagged_lines(batch, _SECRET_PREFILTER))
+            return
+        text = b"".join(batch).decode()
+        sanitized = _redact_within_lines(text) if _has_secret_marker(text) else text
+        if sanitized is None:
+            sanitized = "".join(sanitize_secrets(line.decode()) for line in batch)
+        parts.append(sanitized)
+
+    for line in lines:
+        batch.append(line)
+        batch_size += len(line)
+        if batch_size >= SANITIZE_CHUNK_SIZE:
+            flush()
+            batch = []
+            batch_size = 0
+    if batch:
+        flush()
+
+    return "".join(parts)
+
+
+@lru_cache(maxsize=4096)
+def _date_from_prefix(prefix: str) -> date:
+    """Parse a YYYY-MM-DD string; cached since entries share a few dates."""
+    return date(int(prefix[0:4]), int(prefix[5:7]), int(prefix[8:10]))
+
+
+def _fast_date(timestamp: str) -> date:
+    """Get the date of an ISO-8601 timestamp without building a datetime.
+
+    Falls back to datetime.fromisoformat for anything not starting with
+    YYYY-MM-DD followed by "T", a space or nothing; raises ValueError if the
+    timestamp cannot be parsed.
+    """
+    if _ISO_DATE_PREFIX_RE.match(timestamp):
+        try:
+            return _date_from_prefix(timestamp[:10])
+        except ValueError:
+            pass
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).date()
+
+
+@lru_cache(maxsize=1024)
 def get_project_name(folder_name: str) -> str:
     """Extract project name from Claude folder name."""
     # Format: -Users-joopsnijder-Projects-<project-name>
@@ -129,23 +432,48 @@ def get_vscode_workspace_name(storage_dir: Path) -> str | None:
     return None
 
 
+def _list_files(directory: Path, suffix: str) -> list[Path]:
+    """List the files directly inside directory whose name ends with suffix."""
+    with os.scandir(directory) as entries:
+        return [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(suffix) and entry.is_file()
+        ]
+
+
+def _list_dirs(directory: Path) -> list[Path]:
+    """List the subdirectories directly inside directory."""
+    with os.scandir(directory) as entries:
+        return [Path(entry.path) for entry in entries if entry.is_dir()]
+
+
+def _walk_files(directory: Path, suffix: str) -> list[Path]:
+    """Recursively list files under directory ending with suffix, sorted."""
+    return sorted(
+        Path(root, name)
+        for root, _, names in os.walk(directory)
+        for name in names
+        if name.endswith(suffix)
+    )
+
+
 def filter_transcripts_by_date(target_date: date) -> dict[str, list[Path]]:
     """Find all Claude Code transcript files that contain messages from the target date."""
     projects_with_transcripts: dict[str, list[Path]] = {}
+    project_files: list[tuple[str, Path]] = []
 
-    for project_dir in CLAUDE_PROJECTS_DIR.iterdir():
-        if not project_dir.is_dir():
-            continue
-
+    for project_dir in _list_dirs(CLAUDE_PROJECTS_DIR):
         project_name = get_project_name(project_dir.name)
-        matching_files = []
+        for jsonl_file in _list_files(project_dir, ".jsonl"):
+            project_files.append((project_name, jsonl_file))
 
-        for jsonl_file in project_dir.glob("*.jsonl"):
-            if has_messages_on_date(jsonl_file, target_date):
-                matching_files.append(jsonl_file)
+    # Scan every file up front so independent files can be scanned in parallel
+    results = scan_files([jsonl_file for _, jsonl_file in project_files], target_date)
 
-        if matching_files:
-            projects_with_transcripts[project_name] = matching_files
+    for (project_name, jsonl_file), (has_match, _) in zip(project_files, results):
+        if has_match:
+            projects_with_transcripts.setdefault(project_name, []).append(jsonl_file)
 
     return projects_with_transcripts
 
@@ -157,10 +485,7 @@ def filter_copilot_transcripts_by_date(target_date: date) -> dict[str, list[Path
 
     projects_with_transcripts: dict[str, list[Path]] = {}
 
-    for storage_dir in VSCODE_WORKSPACE_STORAGE_DIR.iterdir():
-        if not storage_dir.is_dir():
-            continue
-
+    for storage_dir in _list_dirs(VSCODE_WORKSPACE_STORAGE_DIR):
         transcripts_dir = storage_dir / "GitHub.copilot-chat" / "transcripts"
         if not transcripts_dir.exists():
             continue
@@ -173,7 +498,7 @@ def filter_copilot_transcripts_by_date(target_date: date) -> dict[str, list[Path
         keyed_name = f"copilot:{project_name}"
         matching_files = []
 
-        for jsonl_file in transcripts_dir.glob("*.jsonl"):
+        for jsonl_file in _list_files(transcripts_dir, ".jsonl"):
             if has_messages_on_date(jsonl_file, target_date):
                 matching_files.append(jsonl_file)
 
@@ -188,12 +513,13 @@ def convert_copilot_transcript_to_markdown(jsonl_file: Path, target_date: date)
     lines_out: list[str] = []
 
     try:
-        with open(jsonl_file) as f:
+        # Binary mode lets orjson parse the raw bytes without a decode step
+        with open(jsonl_file, "rb") as f:
             for line in f:
                 if not line.strip():
                     continue
                 try:
-                    entry = json.loads(line)
+                    entry = _json_loads(line)
                 except json.JSONDecodeError:
                     continue
 
@@ -202,9 +528,7 @@ def convert_copilot_transcript_to_markdown(jsonl_file: Path, target_date: date)
                     continue
 
                 try:
-                    entry_date = datetime.fromisoformat(
-                        timestamp.replace("Z", "+00:00")
-                    ).date()
+                    entry_date = _fast_date(timestamp)
                 except ValueError:
                     continue
 
@@ -230,7 +554,7 @@ def convert_copilot_transcript_to_markdown(jsonl_file: Path, target_date: date)
                         tool_name = tool.get("name", "")
                         args_raw = tool.get("arguments", "")
                         try:
-                            args = json.loads(args_raw) if isinstance(args_raw, str) else args_raw
+                            args = _json_loads(args_raw) if isinstance(args_raw, str) else args_raw
                             explanation = args.get("explanation", "")
                             goal = args.get("goal", "")
                             label = explanation or goal or ""
@@ -344,7 +668,7 @@ def convert_opencode_session_to_markdown(session_id: str, target_date: date) ->
 
             for part_row in parts:
                 try:
-                    part = json.loads(part_row["data"])
+                    part = _json_loads(part_row["data"])
                 except Exception:
                     continue
 
@@ -393,27 +717,351 @@ def collect_opencode_transcripts_for_date(target_date: date) -> dict[str, str]:
     return result
 
 
-def has_messages_on_date(jsonl_file: Path, target_date: date) -> bool:
-    """Check if a JSONL file contains messages from the target date."""
+def _empty_stats() -> dict[str, int]:
+    """Return a zeroed statistics dict."""
+    return {
+        "prompts": 0,
+        "messages": 0,
+        "tool_calls": 0,
+        "commits": 0,
+    }
+
+
+# Per-file scan results keyed by (path, mtime, size, date), shared by the
+# filter, stats and conversion steps so each file is only read once. The
+# filtered text is None for results loaded from the persistent scan cache.
+_scan_cache: dict[
+    tuple[Path, int, int, date], tuple[bool, dict[str, int], str | None]
+] = {}
+
+# Persistent scan cache, opened by open_scan_cache()
+_scan_db: sqlite3.Connection | None = None
+
+
+def open_scan_cache(db_path: Path | None = None) -> None:
+    """Keep scan results in a SQLite database so later runs can skip reading.
+
+    Only whether a file matches and its statistics are stored, not the
+    transcript text itself. Results from another SCAN_CACHE_VERSION, or for
+    target dates older than SCAN_CACHE_KEEP_DAYS, are deleted on opening.
+    If the database cannot be opened, scanning simply continues without it.
+    """
+    global _scan_db
+    db_path = db_path or SCAN_CACHE_DB
+    oldest_date = date.today() - timedelta(days=SCAN_CACHE_KEEP_DAYS)
     try:
-        with open(jsonl_file) as f:
-            for line in f:
-                if not line.strip():
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(db_path))
+        with conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(scans)")}
+            if columns and "version" not in columns:
+                # Written before results were versioned
+                conn.execute("DROP TABLE scans")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS scans (
+                    path TEXT NOT NULL,
+                    target_date TEXT NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    has_match INTEGER NOT NULL,
+                    stats TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    PRIMARY KEY (path, target_date)
+                )
+                """
+            )
+            conn.execute(
+                "DELETE FROM scans WHERE version != ? OR target_date < ?",
+                (SCAN_CACHE_VERSION, oldest_date.isoformat()),
+            )
+    except (OSError, sqlite3.Error):
+        return
+    _scan_db = conn
+
+
+def _scan_cache_key(
+    jsonl_file: Path, target_date: date
+) -> tuple[Path, int, int, date] | None:
+    """Return the scan cache key for a file, or None if it cannot be stat'ed."""
+    try:
+        stat = jsonl_file.stat()
+    except OSError:
+        return None
+    return jsonl_file, stat.st_mtime_ns, stat.st_size, target_date
+
+
+def _earliest_write_ns(target_date: date) -> int:
+    """Earliest file mtime (ns) at which an entry from target_date can exist.
+
+    Entries match on the date in their timestamp, so this is the start of
+    target_date in the earliest timezone (UTC+14).
+    """
+    day_start = datetime.combine(target_date, time.min, tzinfo=timezone.utc)
+    return int((day_start - timedelta(hours=14)).timestamp()) * 1_000_000_000
+
+
+def _cached_scan(
+    key: tuple[Path, int, int, date],
+) -> tuple[bool, dict[str, int], str | None] | None:
+    """Look up a scan result without reading the file, or return None.
+
+    Checks the in-memory cache, then the file's size and mtime against
+    target_date, then the persistent scan cache.
+    """
+    result = _scan_cache.get(key)
+    if result is not None:
+        return result
+
+    path, mtime_ns, size, target_date = key
+    if size == 0 or mtime_ns < _earliest_write_ns(target_date):
+        # Empty, or not written to since before target_date began, so no
+        # entries from it
+        result = _scan_cache[key] = (False, _empty_stats(), "")
+        return result
+
+    if _scan_db is None:
+        return None
+    try:
+        row = _scan_db.execute(
+            "SELECT has_match, stats FROM scans WHERE path = ? AND target_date = ?"
+            " AND mtime_ns = ? AND size = ? AND version = ?",
+            (str(path), target_date.isoformat(), mtime_ns, size, SCAN_CACHE_VERSION),
+        ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+
+    has_match = bool(row[0])
+    # Files without matches have no filtered text, so nothing is missing
+    result = _scan_cache[key] = (has_match, json.loads(row[1]), None if has_match else "")
+    return result
+
+
+def _store_scans(
+    results: list[tuple[tuple[Path, int, int, date], tuple[bool, dict[str, int], str]]],
+) -> None:
+    """Cache scan results in memory and write them through to the scan cache."""
+    for key, result in results:
+        _scan_cache[key] = result
+
+    if _scan_db is None or not results:
+        return
+    try:
+        with _scan_db:
+            _scan_db.executemany(
+                "INSERT OR REPLACE INTO scans VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        str(path),
+                        target_date.isoformat(),
+                        mtime_ns,
+                        size,
+                        has_match,
+                        json.dumps(stats),
+                        SCAN_CACHE_VERSION,
+                    )
+                    for (path, mtime_ns, size, target_date), (
+                        has_match,
+                        stats,
+                        _,
+                    ) in results
+                ],
+            )
+    except sqlite3.Error:
+        pass
+
+
+def _iter_lines(f: BinaryIO) -> Iterator[bytes]:
+    """Yield the lines of a binary file, without their newline.
+
+    Reads READ_CHUNK_SIZE bytes at a time and splits on newlines only; on
+    an unbuffered file each read is a single read(2) call. Only each new
+    chunk is split, and a line spanning chunks is collected in a bytearray,
+    so long lines cost linear time.
+    """
+    tail = bytearray()
+    while chunk := f.read(READ_CHUNK_SIZE):
+        lines = chunk.split(b"\n")
+        if len(lines) == 1:
+            tail += chunk
+            continue
+        tail += lines[0]
+        yield bytes(tail)
+        yield from lines[1:-1]
+        tail = bytearray(lines[-1])
+    if tail:
+        yield bytes(tail)
+
+
+def _has_timestamp_on(f: BinaryIO, target_str: str) -> bool:
+    """Check with one search over the mapped file for a timestamp on target_str.
+
+    Most files have no entries from the target date; this rejects them
+    without splitting and testing every line.
+    """
+    if os.fstat(f.fileno()).st_size == 0:
+        return False
+    pattern = re.compile(rb'"timestamp":\s*"' + re.escape(target_str.encode()))
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return pattern.search(mm) is not None
+
+
+def _scan_jsonl(
+    jsonl_file: Path, target_date: date
+) -> tuple[bool, dict[str, int], str]:
+    """Read a JSONL file once, collecting everything needed for target_date."""
+    try:
+        with open(jsonl_file, "rb", buffering=0) as f:
+            if not _has_timestamp_on(f, target_date.isoformat()):
+                return False, _empty_stats(), ""
+            return scan_stream(f, target_date)
+    except OSError:
+        return False, _empty_stats(), ""
+
+
+def scan_stream(
+    stream: BinaryIO, target_date: date
+) -> tuple[bool, dict[str, int], str]:
+    """Scan JSONL from a binary stream for entries from target_date in one pass.
+
+    Returns the same as scan_file, without caching. Anything with a
+    read(size) method works, such as an io.BytesIO over transcript data
+    already in memory or an mmap of a file that is already mapped.
+    """
+    # Plain local counters keep dict lookups out of the per-line loop
+    prompts = messages = tool_calls = commits = 0
+    kept_lines: list[bytes] = []
+    # Timestamps are ISO-8601, so an entry matches when they start with
+    # target_str. Lines without it anywhere can be skipped before json.loads.
+    target_str = target_date.isoformat()
+    needle = target_str.encode()
+
+    try:
+        for raw_line in _iter_lines(stream):
+            if needle not in raw_line:
+                continue
+            try:
+                entry = _json_loads(raw_line)
+            except (json.JSONDecodeError, ValueError):
+                continue
+
+            timestamp = entry.get("timestamp")
+            if not timestamp or timestamp[:10] != target_str:
+                continue
+
+            # Kept as raw bytes, decoded per batch when sanitizing
+            kept_lines.append(raw_line + b"\n")
+
+            entry_type = entry.get("type")
+            if entry_type == "user":
+                prompts += 1
+                messages += 1
+            elif entry_type == "assistant":
+                messages += 1
+                # Only walk the content when the raw line can hold a
+                # tool call, and only inspect commands that can be commits
+                if b'"tool_use"' not in raw_line:
                     continue
-                try:
-                    entry = json.loads(line)
-                    timestamp = entry.get("timestamp")
-                    if timestamp:
-                        entry_date = datetime.fromisoformat(
-                            timestamp.replace("Z", "+00:00")
-                        ).date()
-                        if entry_date == target_date:
-                            return True
-                except (json.JSONDecodeError, ValueError):
+                may_commit = b"commit" in raw_line
+
+                # Count tool calls in assistant messages
+                message = entry.get("message", {})
+                content = message.get("content", [])
+                if not isinstance(content, list):
                     continue
+                for block in content:
+                    if not isinstance(block, dict):
+                        continue
+                    block_get = block.get
+                    if block_get("type") != "tool_use":
+                        continue
+                    tool_calls += 1
+                    # Check for git commit
+                    if may_commit and block_get("name") == "Bash":
+                        cmd = block_get("input", {}).get("command", "")
+                        if isinstance(cmd, str) and _GIT_COMMIT_RE.search(cmd):
+                            commits += 1
     except Exception:
         pass
-    return False
+
+    stats = {
+        "prompts": prompts,
+        "messages": messages,
+        "tool_calls": tool_calls,
+        "commits": commits,
+    }
+    # Sanitize secrets before the lines end up in a temp file
+    return bool(kept_lines), stats, _sanitize_lines(kept_lines)
+
+
+def scan_file(
+    jsonl_file: Path, target_date: date
+) -> tuple[bool, dict[str, int], str]:
+    """Scan a JSONL file for entries from target_date in a single pass.
+
+    Returns whether the file has entries on that date, the statistics for
+    those entries, and the entries themselves with secrets sanitized.
+    Results are cached until the file is modified. Use scan_stream for data
+    that is not in a file.
+    """
+    key = _scan_cache_key(jsonl_file, target_date)
+    if key is None:
+        return _scan_jsonl(jsonl_file, target_date)
+
+    cached = _cached_scan(key)
+    if cached is not None and cached[2] is not None:
+        return cached[0], cached[1], cached[2]
+
+    result = _scan_jsonl(jsonl_file, target_date)
+    _store_scans([(key, result)])
+    return result
+
+
+def _scan_summary(jsonl_file: Path, target_date: date) -> tuple[bool, dict[str, int]]:
+    """Return whether a file matches target_date and its statistics.
+
+    Unlike scan_file this is answered from the persistent scan cache when
+    possible, without reading the file.
+    """
+    key = _scan_cache_key(jsonl_file, target_date)
+    cached = _cached_scan(key) if key is not None else None
+    if cached is None:
+        cached = scan_file(jsonl_file, target_date)
+    return cached[0], cached[1]
+
+
+def scan_files(
+    jsonl_files: list[Path], target_date: date
+) -> list[tuple[bool, dict[str, int]]]:
+    """Scan several JSONL files, spreading uncached files over worker processes.
+
+    Returns whether each file matches target_date and its statistics, in
+    order. Below PARALLEL_SCAN_MIN_BYTES of uncached files the scan runs
+    in-process, since starting workers would cost more than it saves.
+    """
+    pending: dict[Path, tuple[Path, int, int, date]] = {}
+    for jsonl_file in jsonl_files:
+        key = _scan_cache_key(jsonl_file, target_date)
+        if key is not None and _cached_scan(key) is None:
+            pending[jsonl_file] = key
+
+    workers = min(len(pending), os.cpu_count() or 1)
+    pending_bytes = sum(size for _, _, size, _ in pending.values())
+    if workers > 1 and pending_bytes >= PARALLEL_SCAN_MIN_BYTES:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                _scan_jsonl, pending, repeat(target_date, len(pending))
+            )
+            _store_scans(list(zip(pending.values(), results)))
+
+    return [_scan_summary(jsonl_file, target_date) for jsonl_file in jsonl_files]
+
+
+def has_messages_on_date(jsonl_file: Path, target_date: date) -> bool:
+    """Check if a JSONL file contains messages from the target date."""
+    return _scan_summary(jsonl_file, target_date)[0]
 
 
 def filter_jsonl_by_date(jsonl_file: Path, target_date: date, temp_dir: Path) -> Path:
@@ -422,25 +1070,10 @@ def filter_jsonl_by_date(jsonl_file: Path, target_date: date, temp_dir: Path) ->
     Secrets are sanitized/obfuscated before writing to the temp file.
     """
     temp_jsonl = temp_dir / f"filtered_{jsonl_file.name}"
+    _, _, filtered = scan_file(jsonl_file, target_date)
 
     try:
-        with open(jsonl_file) as source, open(temp_jsonl, "w") as dest:
-            for line in source:
-                if not line.strip():
-                    continue
-                try:
-                    entry = json.loads(line)
-                    timestamp = entry.get("timestamp")
-                    if timestamp:
-                        entry_date = datetime.fromisoformat(
-                            timestamp.replace("Z", "+00:00")
-                        ).date()
-                        if entry_date == target_date:
-                            # Sanitize secrets before writing
-                            sanitized_line = sanitize_secrets(line)
-                            dest.write(sanitized_line)
-                except (json.JSONDecodeError, ValueError):
-                    continue
+        temp_jsonl.write_text(filtered)
     except Exception:
         temp_jsonl.touch()
 
@@ -451,63 +1084,45 @@ def collect_stats(
     project_transcripts: dict[str, list[Path]], target_date: date
 ) -> dict[str, int]:
     """Collect statistics from transcripts for the target date."""
-    stats = {
-        "prompts": 0,
-        "messages": 0,
-        "tool_calls": 0,
-        "commits": 0,
-    }
+    stats = _empty_stats()
+    all_files = [f for jsonl_files in project_transcripts.values() for f in jsonl_files]
 
-    for jsonl_files in project_transcripts.values():
-        for jsonl_file in jsonl_files:
-            try:
-                with open(jsonl_file) as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-                        try:
-                            entry = json.loads(line)
-                            timestamp = entry.get("timestamp")
-                            if not timestamp:
-                                continue
-
-                            entry_date = datetime.fromisoformat(
-                                timestamp.replace("Z", "+00:00")
-                            ).date()
-                            if entry_date != target_date:
-                                continue
-
-                            entry_type = entry.get("type")
-                            if entry_type == "user":
-                                stats["prompts"] += 1
-                                stats["messages"] += 1
-                            elif entry_type == "assistant":
-                                stats["messages"] += 1
-                                # Count tool calls in assistant messages
-                                message = entry.get("message", {})
-                                content = message.get("content", [])
-                                if isinstance(content, list):
-                                    for block in content:
-                                        if (
-                                            isinstance(block, dict)
-                                            and block.get("type") == "tool_use"
-                                        ):
-                                            stats["tool_calls"] += 1
-                                            # Check for git commit
-                                            tool_name = block.get("name", "")
-                                            tool_input = block.get("input", {})
-                                            if tool_name == "Bash":
-                                                cmd = tool_input.get("command", "")
-                                                if "git commit" in cmd:
-                                                    stats["commits"] += 1
-                        except (json.JSONDecodeError, ValueError):
-                            continue
-            except Exception:
-                continue
+    # Files not scanned yet are counted in parallel worker processes
+    for _, file_stats in scan_files(all_files, target_date):
+        for key, value in file_stats.items():
+            stats[key] += value
 
     return stats
 
 
+def _run_claude_code_transcripts(filtered_jsonl: Path, output: Path) -> None:
+    """Convert one filtered JSONL file to HTML with claude-code-transcripts.
+
+    Calls the converter directly when it is importable, otherwise its CLI.
+    """
+    if _generate_html is not None:
+        try:
+            # The converter reports progress on stdout, like the silenced CLI
+            with contextlib.redirect_stdout(io.StringIO()):
+                _generate_html(filtered_jsonl, output)
+        except Exception:
+            pass
+        return
+
+    subprocess.run(
+        [
+            "claude-code-transcripts",
+            "json",
+            str(filtered_jsonl),
+            "-o",
+            str(output),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+
+
 def convert_transcripts_to_html(
     project_transcripts: dict[str, list[Path]], output_dir: Path, target_date: date
 ) -> dict[str, Path]:
@@ -516,65 +1131,187 @@ def convert_transcripts_to_html(
     Only entries matching target_date will be included in the conversion.
     """
     project_html_files: dict[str, Path] = {}
+    filtered_files: list[Path] = []
+    session_outputs: list[Path] = []
 
     for project_name, jsonl_files in project_transcripts.items():
         project_output = output_dir / project_name
         project_output.mkdir(parents=True, exist_ok=True)
 
         for jsonl_file in jsonl_files:
+            # The converter always writes index.html, so give each session
+            # its own folder to keep concurrent conversions apart
+            session_output = project_output / jsonl_file.stem
+            session_output.mkdir(exist_ok=True)
+
             # Filter JSONL to only target date entries
-            filtered_jsonl = filter_jsonl_by_date(
-                jsonl_file, target_date, project_output
+            filtered_files.append(
+                filter_jsonl_by_date(jsonl_file, target_date, session_output)
             )
-
-            subprocess.run(
-                [
-                    "claude-code-transcripts",
-                    "json",
-                    str(filtered_jsonl),
-                    "-o",
-                    str(project_output),
-                ],
-                capture_output=True,
-                check=False,
+            session_outputs.append(session_output)
+
+    workers = min(len(filtered_files), os.cpu_count() or 1)
+    executor: ProcessPoolExecutor | ThreadPoolExecutor | None = None
+    if _generate_html is None:
+        # Conversions are separate processes, so threads are enough to overlap them
+        executor = ThreadPoolExecutor(max_workers=max(workers, 1))
+    elif (
+        workers > 1
+        and sum(f.stat().st_size for f in filtered_files) >= PARALLEL_CONVERT_MIN_BYTES
+    ):
+        # The in-process converter is CPU-bound and keeps module-level state
+        executor = ProcessPoolExecutor(max_workers=workers)
+
+    if executor is None:
+        list(map(_run_claude_code_transcripts, filtered_files, session_outputs))
+    else:
+        with executor:
+            list(
+                executor.map(
+                    _run_claude_code_transcripts, filtered_files, session_outputs
+                )
             )
 
+    for project_name in project_transcripts:
         # Collect all generated HTML files
-        html_files = list(project_output.glob("**/*.html"))
+        project_output = output_dir / project_name
+        html_files = _walk_files(project_output, ".html")
         if html_files:
             project_html_files[project_name] = project_output
 
     return project_html_files
 
 
-def convert_html_to_markdown(html_dir: Path) -> str:
-    """Convert all HTML files in a directory to markdown."""
-    md = MarkItDown()
-    markdown_parts = []
+# Shared MarkItDown instance, created on first use in each process
+_markitdown: MarkItDown | None = None
 
-    for html_file in sorted(html_dir.glob("**/*.html")):
-        try:
-            result = md.convert(str(html_file))
-            if result.text_content:
-                markdown_parts.append(result.text_content)
-        except Exception:
-            continue
 
-    return "\n\n---\n\n".join(markdown_parts)
+def _get_markitdown() -> MarkItDown:
+    """Return this process's MarkItDown instance, creating it if needed."""
+    global _markitdown
+    if _markitdown is None:
+        _markitdown = MarkItDown()
+    return _markitdown
 
 
-def generate_summary(transcripts_markdown: dict[str, str], target_date: date) -> str:
-    """Generate a summary using Claude API."""
-    client = anthropic.Anthropic()
+def _html_file_to_markdown(html_file: Path) -> str:
+    """Convert a single HTML file to markdown, returning "" if that fails.
+
+    With selectolax installed only the text is extracted, by its C parser,
+    which is much faster than MarkItDown but drops markdown formatting.
+    """
+    try:
+        if LexborHTMLParser is not None:
+            tree = LexborHTMLParser(html_file.read_bytes())
+            tree.strip_tags(["script", "style"])
+            if tree.body is None:
+                return ""
+            return tree.body.text(separator="\n", strip=True)
+        result = _get_markitdown().convert(str(html_file))
+        return result.text_content or ""
+    except Exception:
+        return ""
 
-    # Build context from all projects
-    context_parts = []
-    for project_name, markdown in transcripts_markdown.items():
+
+def convert_html_to_markdown(
+    html_dir: Path,
+    budget: int | None = MAX_TRANSCRIPT_CHARS,
+    executor: Executor | None = None,
+) -> str:
+    """Convert all HTML files in a directory to markdown.
+
+    Files are converted in sorted order until the markdown reaches budget
+    characters; generate_summary truncates each project to that length, so
+    later files would be discarded anyway. Pass None to convert every file.
+    With an executor the files are converted concurrently on it.
+    """
+    html_files = _walk_files(html_dir, ".html")
+    separator = "\n\n---\n\n"
+    markdown_parts: list[str] = []
+    total = 0
+
+    futures: list[Future[str]] = []
+    if executor is not None:
+        # Results are taken in submission order to keep the files sorted
+        futures = [executor.submit(_html_file_to_markdown, f) for f in html_files]
+        converted: Iterable[str] = (future.result() for future in futures)
+    else:
+        converted = map(_html_file_to_markdown, html_files)
+
+    try:
+        for part in converted:
+            if not part:
+                continue
+            total += len(part) + (len(separator) if markdown_parts else 0)
+            markdown_parts.append(part)
+            if budget is not None and total >= budget:
+                break
+    finally:
+        # Files past the budget are not needed anymore
+        for future in futures:
+            future.cancel()
+
+    return separator.join(markdown_parts)
+
+
+def convert_projects_to_markdown(
+    project_html: dict[str, Path], budget: int | None = MAX_TRANSCRIPT_CHARS
+) -> dict[str, str]:
+    """Convert the HTML files of each project to markdown.
+
+    Once all projects together hold PARALLEL_CONVERT_MIN_BYTES of HTML, the
+    files are converted in one pool of worker processes shared by all
+    projects; below that, starting the workers costs more than it saves.
+    """
+    html_files = [
+        html_file
+        for html_dir in project_html.values()
+        for html_file in _walk_files(html_dir, ".html")
+    ]
+    workers = min(len(html_files), os.cpu_count() or 1)
+    if (
+        workers < 2
+        or sum(f.stat().st_size for f in html_files) < PARALLEL_CONVERT_MIN_BYTES
+    ):
+        return {
+            project: convert_html_to_markdown(html_dir, budget)
+            for project, html_dir in project_html.items()
+        }
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_get_markitdown if LexborHTMLParser is None else None,
+    ) as executor:
+        return {
+            project: convert_html_to_markdown(html_dir, budget, executor)
+            for project, html_dir in project_html.items()
+        }
+
+
+@lru_cache(maxsize=1)
+def _client() -> anthropic.Anthropic:
+    """Return the shared Anthropic client, so its connection pool is reused."""
+    return anthropic.Anthropic()
+
+
+def stream_summary(
+    transcripts_markdown: dict[str, str], target_date: date
+) -> Iterator[str]:
+    """Generate a summary using Claude API, yielding text as it streams in."""
+    client = _client()
+
+    # Build context from all projects in one buffer
+    context = io.StringIO()
+    for index, (project_name, markdown) in enumerate(transcripts_markdown.items()):
+        if index:
+            context.write("\n\n---\n\n")
+        context.write(f"## Project: {project_name}\n\n")
         # Truncate very long transcripts
-        truncated = markdown[:50000] if len(markdown) > 50000 else markdown
-        context_parts.append(f"## Project: {project_name}\n\n{truncated}")
+        if len(markdown) > MAX_TRANSCRIPT_CHARS:
+            markdown = markdown[:MAX_TRANSCRIPT_CHARS]
+        context.write(markdown)
 
-    full_context = "\n\n---\n\n".join(context_parts)
+    full_context = context.getvalue()
 
     prompt = f"""Analyseer de volgende Claude Code transcripties van {target_date.strftime("%d %B %Y")} en maak een beknopte samenvatting in het Nederlands.
 
@@ -601,16 +1338,17 @@ Beschrijf nieuwe inzichten, technieken, of kennis die is opgedaan tijdens het pr
 
 Houd de samenvatting beknopt maar informatief. Focus op de belangrijkste punten."""
 
-    message = client.messages.create(
+    with client.messages.stream(
         model="claude-sonnet-4-20250514",
         max_tokens=2000,
         messages=[{"role": "user", "content": prompt}],
-    )
+    ) as stream:
+        yield from stream.text_stream
+
 
-    first_block = message.content[0]
-    if isinstance(first_block, TextBlock):
-        return first_block.text
-    return ""
+def generate_summary(transcripts_markdown: dict[str, str], target_date: date) -> str:
+    """Generate a summary using Claude API."""
+    return "".join(stream_summary(transcripts_markdown, target_date))
 
 
 def create_journal(target_date: date) -> Path:
@@ -623,7 +1361,7 @@ def create_journal(target_date: date) -> Path:
     journal_path = output_folder / f"{date_str}-journal.md"
     if not journal_path.exists():
         header = f"# Journal - {target_date.strftime('%d %B %Y')}\n\n"
-        journal_path.write_text(header)
+        journal_path.write_bytes(header.encode("utf-8"))
 
     return journal_path
 
@@ -633,23 +1371,37 @@ def copy_html_files(
 ) -> None:
     """Copy HTML files from temp directory to output folder."""
     for project_name, html_dir in project_html.items():
-        html_files = list(html_dir.glob("**/*.html"))
+        html_files = _walk_files(html_dir, ".html")
         if html_files:
             project_html_folder = output_folder / "html" / project_name
             project_html_folder.mkdir(parents=True, exist_ok=True)
 
             for html_file in html_files:
-                dest = project_html_folder / html_file.name
-                dest.write_text(html_file.read_text())
+                # Keep the per-session folders, every session has an index.html
+                dest = project_html_folder / html_file.relative_to(html_dir)
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                dest.write_bytes(html_file.read_bytes())
+
+
+def _dump_json(data: object) -> bytes:
+    """Serialize data to indented JSON bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
 
 
 def write_output(
-    summary: str,
+    summary: str | Iterable[str],
     stats: dict[str, int],
     target_date: date,
     project_transcripts: dict[str, list[Path]],
 ) -> Path:
-    """Write all output files to a dated folder within a month folder."""
+    """Write all output files to a dated folder within a month folder.
+
+    The summary can also be an iterable of text chunks, such as
+    stream_summary() returns. The chunks are written to a temporary file as
+    they arrive, which replaces the summary once the stream has finished.
+    """
     date_str = target_date.strftime("%Y%m%d")
     month_str = date_str[:6]  # e.g., 202601
     output_folder = OUTPUT_DIR / month_str / date_str
@@ -664,18 +1416,36 @@ def write_output(
         else:
             sources += f"- **{project_name}**\n"
 
-    # Write summary
+    # Write summary, in a single write unless it is streamed
     summary_path = output_folder / f"{date_str}-summary.md"
     header = f"# AI Coding Highlights - {target_date.strftime('%d %B %Y')}\n\n"
-    summary_path.write_text(header + summary + sources)
-
-    # Write journal (empty template)
-    create_journal(target_date)
+    if isinstance(summary, str):
+        summary_path.write_bytes((header + summary + sources).encode("utf-8"))
+    else:
+        # Stream into a temporary file first, so a failing stream leaves an
+        # existing summary untouched
+        partial_path = summary_path.with_name(f".{summary_path.name}.partial")
+        try:
+            with open(partial_path, "wb") as summary_file:
+                summary_file.write(header.encode("utf-8"))
+                for chunk in summary:
+                    summary_file.write(chunk.encode("utf-8"))
+                summary_file.write(sources.encode("utf-8"))
+            os.replace(partial_path, summary_path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+
+    # Write journal (empty template), output_folder already exists
+    journal_path = output_folder / f"{date_str}-journal.md"
+    if not journal_path.exists():
+        header = f"# Journal - {target_date.strftime('%d %B %Y')}\n\n"
+        journal_path.write_bytes(header.encode("utf-8"))
 
     # Write stats as JSON
     stats_path = output_folder / f"{date_str}-stats.json"
     stats_data = {"date": target_date.strftime("%Y-%m-%d"), "stats": stats}
-    stats_path.write_text(json.dumps(stats_data, indent=2))
+    stats_path.write_bytes(_dump_json(stats_data))
 
     return output_folder
 
@@ -703,7 +1473,18 @@ def write_output(
     is_flag=True,
     help="Save HTML transcript files to output directory",
 )
-def main(date_str: str | None, dry_run: bool, init_journal: bool, save_html: bool) -> None:
+@click.option(
+    "--cache/--no-cache",
+    default=True,
+    help="Reuse transcript scan results from earlier runs (default: enabled)",
+)
+def main(
+    date_str: str | None,
+    dry_run: bool,
+    init_journal: bool,
+    save_html: bool,
+    cache: bool,
+) -> None:
     """Generate a daily summary of Claude Code transcripts."""
     # Always create today's journal first (unless disabled)
     if init_journal:
@@ -722,6 +1503,9 @@ def main(date_str: str | None, dry_run: bool, init_journal: bool, save_html: boo
 
     click.echo(f"Processing transcripts for {target_date.strftime('%Y-%m-%d')}...")
 
+    if cache:
+        open_scan_cache()
+
     # Find Claude Code transcripts for the target date
     project_transcripts = filter_transcripts_by_date(target_date)
 
@@ -763,10 +1547,7 @@ def main(date_str: str | None, dry_run: bool, init_journal: bool, save_html: boo
         )
 
         click.echo("Converting HTML to Markdown...")
-        transcripts_markdown = {
-            project: convert_html_to_markdown(html_dir)
-            for project, html_dir in project_html.items()
-        }
+        transcripts_markdown = convert_projects_to_markdown(project_html)
 
         # Add Copilot transcripts as Markdown directly (no HTML conversion needed)
         for project_name, jsonl_files in copilot_transcripts.items():
@@ -785,9 +1566,9 @@ def main(date_str: str | None, dry_run: bool, init_journal: bool, save_html: boo
         click.echo("Collecting statistics...")
         stats = collect_stats(project_transcripts, target_date)
 
-        # Generate summary with Claude
+        # Generate summary with Claude, streamed into the summary file
         click.echo("Generating summary with Claude...")
-        summary = generate_summary(transcripts_markdown, target_date)
+        summary = stream_summary(transcripts_markdown, target_date)
 
         # Write all output files
         # Build a unified sources dict (opencode sessions don't have file paths)